@@ -30,6 +30,9 @@ from eark_validator.const import NO_PATH, NOT_FILE, NOT_VALID_FILE
 from eark_validator.ipxml.namespaces import Namespaces
 from eark_validator.infopacks.manifest import Manifest
 
+METS_ROOT = Namespaces.METS.qualify('mets')
+METS_HDR = Namespaces.METS.qualify('metsHdr')
+
 class PackageDetails:
 
     def __init__(
@@ -92,22 +95,25 @@ class PackageDetails:
         ns = {}
         objid = label = ptype = othertype = contentinformationtype = profile = oaispackagetype = ''
         try:
-            parsed_mets = etree.iterparse(mets_file, events=['start', 'start-ns'])
+            parsed_mets = etree.iterparse(mets_file, events=['start', 'start-ns'],
+                                          remove_blank_text=True, collect_ids=False,
+                                          resolve_entities=False, no_network=True,
+                                          load_dtd=False, huge_tree=False)
             for event, element in parsed_mets:
                 if event == 'start-ns':
                     prefix = element[0]
                     ns_uri = element[1]
                     ns[prefix] = ns_uri
                 if event == 'start':
-                    if element.tag == Namespaces.METS.qualify('mets'):
+                    if element.tag == METS_ROOT:
                         objid = element.get('OBJID', '')
                         label = element.get('LABEL', '')
                         ptype = element.get('TYPE', '')
                         othertype = element.get(Namespaces.CSIP.qualify('OTHERTYPE'), '')
                         contentinformationtype = element.get(Namespaces.CSIP.qualify('CONTENTINFORMATIONTYPE'), '')
                         profile = element.get('PROFILE', '')
-                        oaispackagetype = element.find(Namespaces.METS.qualify('metsHdr')).get(Namespaces.CSIP.qualify('OAISPACKAGETYPE'), '')
-                    elif element.tag == Namespaces.METS.qualify('metsHdr'):
+                        oaispackagetype = element.find(METS_HDR).get(Namespaces.CSIP.qualify('OAISPACKAGETYPE'), '')
+                    elif element.tag == METS_HDR:
                         break
         except etree.XMLSyntaxError:
             raise ValueError(NOT_VALID_FILE.format(mets_file, 'XML'))
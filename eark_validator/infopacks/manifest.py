@@ -23,6 +23,7 @@
 # under the License.
 #
 """Information Package manifests."""
+from dataclasses import dataclass
 from enum import Enum, unique
 import hashlib
 import os
@@ -31,6 +32,10 @@ import lxml.etree as ET
 
 from eark_validator.ipxml.schema import Namespaces
 from eark_validator.const import NO_PATH, NOT_DIR, NOT_FILE
+
+FILE_TAGS = (Namespaces.METS.qualify('file'), 'file')
+MDREF_TAGS = (Namespaces.METS.qualify('mdRef'), 'mdRef')
+
 @unique
 class HashAlgorithms(Enum):
     """Enum covering information package validation statuses."""
@@ -75,26 +80,21 @@ class HashAlgorithms(Enum):
         return algorithms.get(algorithm)
 
 
+@dataclass(frozen=True, slots=True)
 class Checksum:
-    def __init__(self, algorithm: HashAlgorithms, value: str):
-        self._algorithm = algorithm
-        self._value = value.lower()
-
-    @property
-    def algorithm(self) -> HashAlgorithms:
-        """Get the algorithm."""
-        return self._algorithm
+    """An immutable checksum value and the algorithm that produced it."""
+    algorithm: HashAlgorithms
+    value: str
 
-    @property
-    def value(self) -> str:
-        """Get the value."""
-        return self._value
+    def __post_init__(self):
+        # Normalise hex digests so comparison and hashing ignore case
+        object.__setattr__(self, 'value', self.value.lower())
 
     def is_value(self, value: 'Checksum') -> bool:
         """Check if the checksum value is equal to the given value."""
         if isinstance(value, Checksum):
-            return (self._value == value.value) and (self._algorithm == value.algorithm)
-        return self._value == value.lower()
+            return self == value
+        return self.value == value.lower()
 
     @classmethod
     def from_mets_element(cls, element: ET.Element) -> 'Checksum':
@@ -113,8 +113,11 @@ class Checksum:
 
 
 class FileItem:
+    __slots__ = ('_path', '_name', '_size', '_checksum', '_mime')
+
     def __init__(self, path: str, size: int, checksum: Checksum, mime: str):
         self._path = path
+        self._name = os.path.basename(path)
         self._size = size
         self._checksum = checksum
         self._mime = mime
@@ -127,7 +130,7 @@ class FileItem:
     @property
     def name(self) -> str:
         """Get the name."""
-        return os.path.basename(self._path)
+        return self._name
 
     @property
     def size(self) -> int:
@@ -158,9 +161,9 @@ class FileItem:
     def from_element(cls, element: ET.Element) -> 'FileItem':
         """Create a FileItem from an etree element."""
         path = ''
-        if element.tag in [Namespaces.METS.qualify('file'), 'file']:
+        if element.tag in FILE_TAGS:
             path = cls.path_from_file_element(element)
-        elif element.tag in [Namespaces.METS.qualify('mdRef'), 'mdRef']:
+        elif element.tag in MDREF_TAGS:
             path = cls.path_from_mdref_element(element)
         else:
             raise ValueError('Element {} is not a METS:file or METS:mdRef element.'.format(element.tag))
@@ -203,7 +206,7 @@ class Manifest:
     @property
     def size(self) -> int:
         """Get the total file size in bytes."""
-        return sum([item.size for item in self._file_items.values()])
+        return sum(item.size for item in self._file_items.values())
 
     @property
     def items(self) -> dict[str, FileItem]:
@@ -244,11 +247,8 @@ class Manifest:
             raise FileNotFoundError(NO_PATH.format(root_path))
         if (not os.path.isdir(root_path)):
             raise ValueError(NOT_DIR.format(root_path))
-        items = []
-        for subdir, dirs, files in os.walk(root_path):
-            for file in files:
-                file_path = os.path.join(subdir, file)
-                items.append(FileItem.from_file_path(file_path, checksum_algorithm=checksum_algorithm))
+        items = [FileItem.from_file_path(os.path.join(subdir, file), checksum_algorithm=checksum_algorithm)
+                 for subdir, _, files in os.walk(root_path) for file in files]
         return cls(root_path, items)
 
     @classmethod
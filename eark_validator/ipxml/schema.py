@@ -26,15 +26,39 @@
 E-ARK : Information package validation
         Information Package modules
 """
+from functools import lru_cache
+import threading
+
 from lxml import etree
 from importlib_resources import files
 
 from .resources import schema as SCHEMA
 from .namespaces import Namespaces
-IP_SCHEMA = {
-    'csip': etree.XMLSchema(file=str(files(SCHEMA).joinpath('mets.csip.local.v2-0.xsd'))),
-    'sip': etree.XMLSchema(file=str(files(SCHEMA).joinpath('mets.sip.local.v2-0.xsd')))
+
+IP_SCHEMA_FILES = {
+    'csip': 'mets.csip.local.v2-0.xsd',
+    'sip': 'mets.sip.local.v2-0.xsd'
 }
+PROF_SCHEMA_FILE = 'mets.profile.local.v2-0.xsd'
+
+_SCHEMA_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _compile_schema(name: str) -> etree.XMLSchema:
+    return etree.XMLSchema(file=str(files(SCHEMA).joinpath(name)))
+
+def _load_schema(name: str) -> etree.XMLSchema:
+    """Compile the named local schema file on first use, at most once per process."""
+    with _SCHEMA_LOCK:
+        return _compile_schema(name)
+
+def get_ip_schema(ip_type: str='csip') -> etree.XMLSchema:
+    """Return the compiled METS schema for an information package type."""
+    return _load_schema(IP_SCHEMA_FILES[ip_type])
+
+def get_profile_schema() -> etree.XMLSchema:
+    """Return the compiled METS profile schema."""
+    return _load_schema(PROF_SCHEMA_FILE)
 
 LOCAL_SCHEMA = {
     Namespaces.CSIP: 'DILCISExtensionMETS.xsd',
@@ -50,4 +74,10 @@ def get_local_schema(uri: str) -> str:
     """Return the local schema file name for a given namespace URI."""
     return str(files(SCHEMA).joinpath(LOCAL_SCHEMA.get(uri, 'mets.xsd')))
 
-METS_PROF_SCHEMA = etree.XMLSchema(file=str(files(SCHEMA).joinpath('mets.profile.local.v2-0.xsd')))
+def __getattr__(name: str):
+    # The schema constants are built lazily so importing this module stays cheap.
+    if name == 'IP_SCHEMA':
+        return {ip_type: get_ip_schema(ip_type) for ip_type in IP_SCHEMA_FILES}
+    if name == 'METS_PROF_SCHEMA':
+        return get_profile_schema()
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
@@ -23,7 +23,9 @@
 # under the License.
 #
 """Module to capture everything schematron validation related."""
+from functools import lru_cache
 import os
+import threading
 from importlib_resources import files
 from typing import Generator
 
@@ -35,6 +37,18 @@ from eark_validator.const import NO_PATH, NOT_FILE
 
 SCHEMATRON_NS = '{http://purl.oclc.org/dsdl/schematron}'
 SVRL_NS = '{http://purl.oclc.org/dsdl/svrl}'
+SCHEMATRON_ASSERT = SCHEMATRON_NS + 'assert'
+# lxml serialises every parse made with the same parser, so each thread gets its own
+_PARSERS = threading.local()
+
+def _parser() -> ET.XMLParser:
+    # No XML ID table is needed by the rules and DTDs, entity expansion and network
+    # access are never needed for METS documents.
+    parser = getattr(_PARSERS, 'parser', None)
+    if parser is None:
+        parser = _PARSERS.parser = ET.XMLParser(collect_ids=False, resolve_entities=False,
+                                                no_network=True, load_dtd=False, huge_tree=False)
+    return parser
 
 class SchematronRuleset():
     """Encapsulates a set of Schematron rules loaded from a file."""
@@ -44,6 +58,8 @@ class SchematronRuleset():
         if not os.path.isfile(sch_path):
             raise ValueError(NOT_FILE.format(sch_path))
         self._path = sch_path
+        # Guards the shared report the Schematron object stores for each validation
+        self._lock = threading.Lock()
         try:
             self._schematron = Schematron(file=self._path, store_schematron=True, store_report=True)
         except ET.SchematronParseError as ex:
@@ -62,17 +78,30 @@ class SchematronRuleset():
         return self._schematron
 
     def get_assertions(self) -> Generator[ ET.Element, None, None]:
-        """Generator that returns the rules one at a time."""
-        xml_rules = ET.XML(bytes(self.schematron.schematron))
-        for ele in xml_rules.iter():
-            if ele.tag == SCHEMATRON_NS + 'assert':
-                yield ele
+        """Generator that returns the rules one at a time.
+
+        The yielded elements are the ruleset's own parsed tree, which is shared by every
+        profile using a cached ruleset, treat them as read-only."""
+        # The stored schematron is already a parsed tree, filter it by tag in place
+        yield from self.schematron.schematron.iter(SCHEMATRON_ASSERT)
 
     def validate(self, to_validate: str) -> ET.Element:
         """Validate a file against the loaded Schematron ruleset."""
-        xml_file = ET.parse(to_validate)
-        self.schematron.validate(xml_file)
-        return self.schematron.validation_report
+        xml_file = ET.parse(to_validate, parser=_parser())
+        with self._lock:
+            self.schematron.validate(xml_file)
+            return self.schematron.validation_report
+
+# Bounded to a little over the number of packaged rules files, each cached ruleset
+# also holds on to the report from its most recent validation.
+@lru_cache(maxsize=32)
+def load_ruleset(sch_path: str) -> SchematronRuleset:
+    """Return the shared ruleset for a Schematron file, compiling it only on first request."""
+    return SchematronRuleset(sch_path)
+
+def clear_ruleset_cache() -> None:
+    """Discard cached rulesets, e.g. after rules files have changed on disk."""
+    load_ruleset.cache_clear()
 
 def get_schematron_path(id: str, section: str) -> str:
     return str(files(SCHEMATRON).joinpath(id).joinpath('mets_{}_rules.xml'.format(section)))
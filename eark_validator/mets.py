@@ -28,9 +28,16 @@ import os
 from lxml import etree
 
 from eark_validator.infopacks.manifest import FileItem, Manifest
-from eark_validator.ipxml.schema import IP_SCHEMA
+from eark_validator.ipxml.schema import get_ip_schema
 from eark_validator.ipxml.namespaces import Namespaces
 
+# Qualified tags compared against every parsed element, built once
+METS_DIV = Namespaces.METS.qualify('div')
+METS_FILE = Namespaces.METS.qualify('file')
+METS_MDREF = Namespaces.METS.qualify('mdRef')
+METS_MPTR = Namespaces.METS.qualify('mptr')
+XLINK_HREF = Namespaces.XLINK.qualify('href')
+
 class MetsValidator():
     """Encapsulates METS schema validation."""
     def __init__(self, root: str):
@@ -70,7 +77,8 @@ class MetsValidator():
         Validates a Mets file. The Mets file is parsed with etree.iterparse(),
         which allows event-driven parsing of large files. On certain events/conditions
         actions are taken, like file validation or adding Mets files found inside
-        representations to a list so that they will be evaluated later on.
+        representations to a list so that they will be evaluated later on. File
+        references are released from the tree once processed.
 
         @param mets:    Path leading to a Mets file that will be evaluated.
         @return:        Boolean validation result.
@@ -78,7 +86,8 @@ class MetsValidator():
         # Handle relative package paths for representation METS files.
         self._package_root, mets = _handle_rel_paths(self._package_root, mets)
         try:
-            parsed_mets = etree.iterparse(mets, schema=IP_SCHEMA.get('csip'))
+            parsed_mets = etree.iterparse(mets, schema=get_ip_schema('csip'), resolve_entities=False,
+                                          no_network=True, load_dtd=False, huge_tree=False)
             for event, element in parsed_mets:
                 self._process_element(element)
         except etree.XMLSyntaxError as synt_err:
@@ -87,18 +96,32 @@ class MetsValidator():
 
     def _process_element(self, element: etree.Element) -> None:
         # Define what to do with specific tags.
-        if element.tag == Namespaces.METS.qualify('div') and \
+        if element.tag == METS_DIV and \
             element.attrib['LABEL'].startswith('Representations/'):
             self._process_rep_div(element)
             return
-        if element.tag == Namespaces.METS.qualify('file') or element.tag == Namespaces.METS.qualify('mdRef'):
+        if element.tag in (METS_FILE, METS_MDREF):
             self._file_refs.append(FileItem.from_element(element))
+            _release_element(element)
 
     def _process_rep_div(self, element: etree.Element) -> None:
         rep = element.attrib['LABEL'].rsplit('/', 1)[1]
         for child in element.getchildren():
-            if child.tag == Namespaces.METS.qualify('mptr'):
-                self._reps_mets.update({rep:  child.attrib[Namespaces.XLINK.qualify('href')]})
+            if child.tag == METS_MPTR:
+                self._reps_mets.update({rep:  child.attrib[XLINK_HREF]})
+
+def _release_element(element: etree.Element) -> None:
+    # Drop a processed element and its already processed file siblings so that memory
+    # use stays flat however many files a METS document references. A file nested in
+    # another file is left alone, its parent still needs its own FLocat when it ends.
+    parent = element.getparent()
+    if parent is None or parent.tag == METS_FILE:
+        return
+    element.clear(keep_tail=True)
+    previous = element.getprevious()
+    while previous is not None and previous.tag in (METS_FILE, METS_MDREF):
+        parent.remove(previous)
+        previous = element.getprevious()
 
 def _handle_rel_paths(rootpath: str, metspath: str) -> tuple[str, str]:
     if metspath.startswith('file:///') or os.path.isabs(metspath):
@@ -23,16 +23,23 @@
 # under the License.
 #
 """Module to capture everything schematron validation related."""
+from dataclasses import dataclass
 from enum import Enum, unique
+from functools import lru_cache
+from itertools import repeat
 import os
 from importlib_resources import files
 
 from lxml import etree as ET
 
-from eark_validator.ipxml.schematron import SchematronRuleset, SVRL_NS, get_schematron_path
+from eark_validator.ipxml.schematron import SchematronRuleset, SVRL_NS, get_schematron_path, load_ruleset
 from eark_validator.specifications.specification import EarkSpecifications, Specification
 from eark_validator.const import NO_PATH, NOT_FILE
 
+SVRL_FIRED_RULE = SVRL_NS + 'fired-rule'
+SVRL_RESULTS = (SVRL_NS + 'failed-assert', SVRL_NS + 'successful-report')
+SVRL_TEXT = SVRL_NS + 'text'
+
 class ValidationProfile():
     """ A complete set of Schematron rule sets that comprise a complete validation profile."""
     def __init__(self, specification: Specification):
@@ -43,7 +50,7 @@ class ValidationProfile():
         self.results = {}
         self.messages = []
         for section in specification.sections:
-            self.rulesets[section] = SchematronRuleset(get_schematron_path(specification.id, section))
+            self.rulesets[section] = load_ruleset(get_schematron_path(specification.id, section))
 
     @property
     def specification(self) -> Specification:
@@ -76,6 +83,24 @@ class ValidationProfile():
             if not self.results[section].is_valid:
                 self.is_valid = False
 
+    def validate_files(self, to_validate: list[str],
+                       workers: int=None) -> list[tuple[dict[str, 'TestReport'], list[str]]]:
+        """Validate a batch of files using a pool of worker processes.
+
+        Each worker loads the profile's rulesets once and reuses them for every file
+        it is handed. A (results, messages) pair is returned for each file, in the order
+        the files were supplied. A file that isn't well formed XML has empty results and
+        a message giving the parse error."""
+        # Imported here as the process pool machinery is costly to load and rarely used
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+        # Spawn fresh workers, a forked worker could inherit ruleset or parser locks
+        # held by another thread of this process and block forever.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(_validate_file, repeat(self.specification.id), to_validate,
+                                     chunksize=16))
+
     def get_results(self) -> dict[str, 'TestReport']:
         """Return the full set of results."""
         return self.results
@@ -95,6 +120,15 @@ class ValidationProfile():
             raise ValueError('Specification must be a Specification instance or valid specification ID.')
         return cls(specification)
 
+@lru_cache(maxsize=None)
+def _worker_profile(spec_id: str) -> ValidationProfile:
+    return ValidationProfile.from_specification(spec_id)
+
+def _validate_file(spec_id: str, to_validate: str) -> tuple[dict[str, 'TestReport'], list[str]]:
+    profile = _worker_profile(spec_id)
+    profile.validate(to_validate)
+    return profile.get_results(), profile.messages
+
 @unique
 class Severity(Enum):
     """Enum covering information package validation statuses."""
@@ -116,6 +150,8 @@ class Severity(Enum):
 
 class TestResult():
     """Encapsulates an individual validation test result."""
+    __slots__ = ('_rule_id', '_severity', '_location', '_message')
+
     def __init__(self, rule_id: str, location: 'SchematronLocation', message: str, severity: Severity = Severity.UNKNOWN):
         self._rule_id = rule_id
         self._severity = severity
@@ -151,13 +187,13 @@ class TestResult():
         return self._message
 
     def __str__(self) -> str:
-        return str(self.rule_id) + ' ' + str(self.severity) + ' ' + str(self.location)
+        return f'{self._rule_id} {self._severity} {self._location}'
 
     def to_json(self) -> dict:
         """Output the error message in JSON form."""
-        return {'rule_id' : self.rule_id, 'severity' : str(self.severity.name),
-                'test' : self.location.test, 'location' : self.location.location,
-                'message' : self.message}
+        return {'rule_id' : self._rule_id, 'severity' : str(self._severity.name),
+                'test' : self._location.test, 'location' : self._location.location,
+                'message' : self._message}
 
     @classmethod
     def from_element(cls, rule: ET.Element, failed_assert: ET.Element) -> 'TestResult':
@@ -167,7 +203,7 @@ class TestResult():
         test = failed_assert.get('test')
         severity = Severity.from_id(failed_assert.get('role', Severity.UNKNOWN.name))
         location = failed_assert.get('location')
-        message = failed_assert.find(SVRL_NS + 'text').text
+        message = failed_assert.find(SVRL_TEXT).text
         schmtrn_loc = SchematronLocation(context, test, location)
         return cls(rule_id, schmtrn_loc, message, severity)
 
@@ -201,49 +237,34 @@ class TestReport():
         return self._infos
 
     @classmethod
-    def from_validation_report(cls, ruleset: ET.Element) -> 'TestReport':
+    def from_validation_report(cls, ruleset: ET.ElementTree) -> 'TestReport':
         """Get the report from the last validation."""
-        xml_report = ET.XML(bytes(ruleset))
         failures = []
         warnings = []
         infos = []
+        # Non-failing roles and the list their results are collected in
+        by_role = {'INFO': infos, 'WARN': warnings}
         is_valid = True
         rule = None
-        for ele in xml_report.iter():
-            if ele.tag == SVRL_NS + 'fired-rule':
+        # Walk the SVRL result tree in place rather than serialising and re-parsing it
+        for ele in ruleset.iter():
+            if ele.tag == SVRL_FIRED_RULE:
                 rule = ele
-            elif (ele.tag == SVRL_NS + 'failed-assert') or (ele.tag == SVRL_NS + 'successful-report'):
-                if ele.get('role') == 'INFO':
-                    infos.append(TestResult.from_element(rule, ele))
-                elif ele.get('role') == 'WARN':
-                    warnings.append(TestResult.from_element(rule, ele))
-                else:
+            elif ele.tag in SVRL_RESULTS:
+                results = by_role.get(ele.get('role'))
+                if results is None:
                     is_valid = False
-                    failures.append(TestResult.from_element(rule, ele))
+                    results = failures
+                results.append(TestResult.from_element(rule, ele))
         return TestReport(is_valid, failures, warnings, infos)
 
 
+@dataclass(frozen=True, slots=True)
 class SchematronLocation():
-    """All details of the location of a Schematron error."""
-    def __init__(self, context: str, test: str, location: str):
-        self._context = context
-        self._test = test
-        self._location = location
-
-    @property
-    def context(self) -> str:
-        """Get the context of the location."""
-        return self._context
-
-    @property
-    def test(self) -> str:
-        """Get the location test."""
-        return self._test
-
-    @property
-    def location(self) -> str:
-        """Get the location location."""
-        return self._location
+    """All details of the location of a Schematron error, immutable once created."""
+    context: str
+    test: str
+    location: str
 
     def __str__(self) -> str:
-        return str(self.context) + ' ' + str(self.test) + ' ' + str(self.location)
+        return f'{self.context} {self.test} {self.location}'
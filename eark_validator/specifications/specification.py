@@ -24,17 +24,30 @@
 #
 """Module covering information package structure validation and navigation."""
 from enum import Enum, unique
+from functools import lru_cache
 from lxml import etree as ET
 import os
 
 from importlib_resources import files
 
 from eark_validator.ipxml import PROFILES
-from eark_validator.ipxml.schema import METS_PROF_SCHEMA
+from eark_validator.ipxml.schema import get_profile_schema
 from eark_validator.ipxml.namespaces import Namespaces
 from eark_validator.specifications.struct_reqs import STRUCT_REQS
 from eark_validator.const import NOT_FILE, NO_PATH
 
+# Profile child elements whose text is copied straight into a Specification field
+PROFILE_TEXT_FIELDS = {
+    Namespaces.PROFILE.qualify('title'): 'title',
+    Namespaces.PROFILE.qualify('date'): 'date',
+    Namespaces.PROFILE.qualify('URI'): 'profile',
+    'URI': 'profile'
+}
+PROFILE_REQUIREMENTS = Namespaces.PROFILE.qualify('structural_requirements')
+# A requirement's name is the text of its description head, compiled once for reuse
+REQUIREMENT_NAME = ET.XPath('string(profile:description/profile:head)',
+                            namespaces={'profile': Namespaces.PROFILE.id}, smart_strings=False)
+
 class Specification:
     """Stores the vital facts and figures an IP specification."""
     def __init__(self, title: str, url: str, version: str, date: str, requirements:dict[str, 'Requirement']=None):
@@ -72,21 +85,21 @@ class Specification:
     @property
     def requirements(self):
         """Get the specification rules."""
-        for section in self.sections:
-            for requirement in self._requirements[section].values():
+        for section_reqs in self._requirements.values():
+            for requirement in section_reqs.values():
                 yield requirement
 
     @property
     def requirement_count(self) -> int:
         """Return the number of requirments in the specification."""
         req_count = 0
-        for sect in self.sections:
-            req_count += len(self._requirements[sect])
+        for section_reqs in self._requirements.values():
+            req_count += len(section_reqs)
         return req_count
 
     def get_requirement_by_id(self, id: str) -> 'Requirement':
         """Retrieve a requirement by id."""
-        for sect in self.sections:
+        for sect in self._requirements:
             req = self.get_requirement_by_sect(id, sect)
             if req:
                 return req
@@ -105,8 +118,8 @@ class Specification:
         if section:
             requirements = self._requirements[section]
         else:
-            for sect in self.sections:
-                requirements += self._requirements[sect].values()
+            for section_reqs in self._requirements.values():
+                requirements += section_reqs.values()
         return requirements
 
     @property
@@ -120,8 +133,7 @@ class Specification:
         return self._requirements.keys()
 
     def __str__(self) -> str:
-        return 'name:' + self.title + ', version:' + \
-            str(self.version) + ', date:' + str(self.date)
+        return f'name:{self._title}, version:{self._version}, date:{self._date}'
 
     @classmethod
     def _from_xml_file(cls, xml_file: str, add_struct: bool=False) -> 'Specification':
@@ -135,9 +147,8 @@ class Specification:
 
     @classmethod
     def _parser(cls) -> ET.XMLParser:
-        """Create a parser for the specification."""
-        parser = ET.XMLParser(schema=METS_PROF_SCHEMA, resolve_entities=False, no_network=True)
-        return parser
+        """Return the shared parser that validates specifications as they're parsed."""
+        return _profile_parser()
 
     @classmethod
     def _from_xml(cls, tree: ET.ElementTree, add_struct: bool=False) -> 'Specification':
@@ -148,43 +159,35 @@ class Specification:
     def from_element(cls, spec_ele: ET.Element, add_struct: bool=False) -> 'Specification':
         """Create a Specification from an XML element."""
         version = spec_ele.get('ID')
-        title = date = ''
+        values = {'title': '', 'date': '', 'profile': ''}
         requirements = {}
-        profile = ''
-        # Loop through the child eles
+        # Loop through the child eles, looking up the value each tag populates
         for child in spec_ele:
-            if child.tag == Namespaces.PROFILE.qualify('title'):
-                # Process the title element
-                title = child.text
-            elif child.tag == Namespaces.PROFILE.qualify('date'):
-                # Grab the requirement text value
-                date = child.text
-            elif child.tag == Namespaces.PROFILE.qualify('structural_requirements'):
+            field = PROFILE_TEXT_FIELDS.get(child.tag)
+            if field:
+                values[field] = child.text
+            elif child.tag == PROFILE_REQUIREMENTS:
                 requirements = cls._processs_requirements(child)
-            elif child.tag in [Namespaces.PROFILE.qualify('URI'), 'URI']:
-                profile = child.text
         if add_struct:
             # Add the structural requirements
             struct_reqs = Specification.StructuralRequirement._get_struct_reqs()
             requirements['structure'] = struct_reqs
         # Return the Specification
-        return cls(title, profile, version, date, requirements=requirements)
+        return cls(values['title'], values['profile'], version, values['date'], requirements=requirements)
 
     @classmethod
     def _processs_requirements(cls, req_root: ET.Element) -> dict[str, 'Requirement']:
         requirements = {}
         for sect_ele in req_root:
             section = sect_ele.tag.replace(Namespaces.PROFILE.qualifier, '')
-            reqs = {}
-            for req_ele in sect_ele:
-                requirement = cls.Requirement.from_element(req_ele)
-                if not requirement.id.startswith('REF_'):
-                    reqs.update({requirement.id: requirement})
-            requirements[section] = reqs
+            reqs = (cls.Requirement.from_element(req_ele) for req_ele in sect_ele)
+            requirements[section] = {req.id: req for req in reqs if not req.id.startswith('REF_')}
         return requirements
 
     class Requirement():
         """Encapsulates a requirement."""
+        __slots__ = ('_id', '_name', '_level', '_xpath', '_cardinality')
+
         def __init__(self, req_id: str, name: str, level: str='MUST', xpath: str=None, cardinality: str=None):
             self._id = req_id
             self._name = name
@@ -218,23 +221,20 @@ class Specification:
             return self._cardinality
 
         def __str__(self) -> str:
-            return 'id:' + self.id + ', name:' + self.name
+            return f'id:{self._id}, name:{self._name}'
 
         @classmethod
         def from_element(cls, req_ele: ET.Element) -> 'Specification.Requirement':
             """Return a Requirement instance from an XML element."""
             req_id = req_ele.get('ID')
             level = req_ele.get('LEVEL')
-            name = ''
-            for child in req_ele:
-                if child.tag == Namespaces.METS.qualify('description'):
-                    for req_child in child:
-                        if req_child.tag == Namespaces.METS.qualify('head'):
-                            name = req_child.text
+            name = REQUIREMENT_NAME(req_ele)
             return cls(req_id, name, level)
 
     class StructuralRequirement():
         """Encapsulates a structural requirement."""
+        __slots__ = ('_id', '_level', '_message')
+
         def __init__(self, req_id: str, level: str='MUST', message: str=None):
             self._id = req_id
             self._level = level
@@ -256,7 +256,7 @@ class Specification:
             return self._message
 
         def __str__(self) -> str:
-            return 'id:' + self.id + ', level:' + str(self.level)
+            return f'id:{self._id}, level:{self._level}'
 
         @classmethod
         def from_rule_no(cls, rule_no: int) -> 'Specification.StructuralRequirement':
@@ -277,15 +277,18 @@ class Specification:
 
         @staticmethod
         def _get_struct_reqs() -> list['Specification.StructuralRequirement']:
-            reqs = []
-            for req_num in STRUCT_REQS:
-                req = STRUCT_REQS.get(req_num)
-                reqs.append(Specification.StructuralRequirement(req.get('id'),
-                                                                level=req.get('level'),
-                                                                message=req.get('message')))
-            return reqs
+            return [Specification.StructuralRequirement(req.get('id'),
+                                                        level=req.get('level'),
+                                                        message=req.get('message'))
+                    for req in STRUCT_REQS.values()]
 
 
+@lru_cache(maxsize=None)
+def _profile_parser() -> ET.XMLParser:
+    # Built on first use, after the profile schema it carries can be compiled
+    return ET.XMLParser(schema=get_profile_schema(), resolve_entities=False, no_network=True,
+                        load_dtd=False, huge_tree=False, remove_blank_text=True, collect_ids=False)
+
 @unique
 class EarkSpecifications(Enum):
     """Enumeration of E-ARK specifications."""
@@ -306,12 +309,12 @@ class EarkSpecifications(Enum):
     @property
     def path(self) -> str:
         """Get the path to the specification file."""
-        self._path
+        return self._path
 
     @property
     def title(self) -> str:
         """Get the specification title."""
-        self._title
+        return self._title
 
     @property
     def specification(self) -> Specification:
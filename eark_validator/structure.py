@@ -94,11 +94,11 @@ class StructureReport:
     @property
     def messages(self):
         """Generator that yields all of the messages in the report."""
-        for entry in self.errors:
+        for entry in self._errors:
             yield entry
-        for entry in self.warnings:
+        for entry in self._warnings:
             yield entry
-        for entry in self.infos:
+        for entry in self._infos:
             yield entry
 
     def add_error(self, error: str) -> None:
@@ -153,10 +153,12 @@ class StructureReport:
 
 
     def __str__(self):
-        return 'status:' + str(self.status)
+        return f'status:{self._status}'
 
 class StructError():
     """Encapsulates an individual validation test result."""
+    __slots__ = ('_requirement', '_severity', '_sub_message')
+
     def __init__(self, requirement: str, sub_message: str):
         self._requirement = requirement
         self.severity = LEVEL_SEVERITY.get(requirement.level, Severity.UNKNOWN)
@@ -181,17 +183,17 @@ class StructError():
     @property
     def is_error(self) -> bool:
         """Returns True if this is an error message, false otherwise."""
-        return self.severity == Severity.ERROR
+        return self._severity == Severity.ERROR
 
     @property
     def is_info(self) -> bool:
         """Returns True if this is an info message, false otherwise."""
-        return self.severity == Severity.INFO
+        return self._severity == Severity.INFO
 
     @property
     def is_warning(self) -> bool:
         """Returns True if this is an warning message, false otherwise."""
-        return self.severity == Severity.WARN
+        return self._severity == Severity.WARN
 
     @property
     def message(self) -> str:
@@ -205,14 +207,12 @@ class StructError():
 
     def to_json(self) -> dict:
         """Output the message in JSON format."""
-        return {'id' : self.id, 'severity' : str(self.severity.name),
-                'message' : self.message, 'sub_message' : self.sub_message}
+        return {'id' : self._requirement.id, 'severity' : str(self._severity.name),
+                'message' : self._requirement.message, 'sub_message' : self._sub_message}
 
     def __str__(self) -> str:
-        return 'id:{}, severity:{}, message:{}, sub_message:{}'.format(self.id,
-                                                                       str(self.severity.name),
-                                                                       self.message,
-                                                                       self.sub_message)
+        return f'id:{self._requirement.id}, severity:{self._severity.name}, ' \
+               f'message:{self._requirement.message}, sub_message:{self._sub_message}'
     @classmethod
     def from_rule_no(cls, rule_no: int, sub_message: str=None) -> 'StructError':
         """Create an StructError from values supplied."""
@@ -69,10 +69,12 @@ setup(name='eark-validator',
       classifiers=[
           'Intended Audience :: Developers',
           'Programming Language :: Python :: 3',
-          'Programming Language :: Python :: 3.5',
-          'Programming Language :: Python :: 3.6',
+          'Programming Language :: Python :: 3.10',
+          'Programming Language :: Python :: 3.11',
+          'Programming Language :: Python :: 3.12',
           'Topic :: System :: Archiving',
       ],
+      python_requires='>=3.10',
       install_requires=INSTALL_REQUIRES,
       setup_requires=SETUP_REQUIRES,
       tests_require=TEST_DEPS,
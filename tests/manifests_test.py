@@ -135,6 +135,19 @@ class ChecksumTest(unittest.TestCase):
         self.assertEqual(checksum.algorithm, HashAlgorithms.SHA256)
         self.assertTrue(checksum.is_value('F37E90511B5DDE2E9C60378A0F0A0A1CF07145C8F12651E0E19731892C608DA7'))
 
+    def test_value_equality(self):
+        lower = Checksum(HashAlgorithms.MD5, 'abc123')
+        upper = Checksum(HashAlgorithms.MD5, 'ABC123')
+        self.assertEqual(lower, upper)
+        self.assertEqual(hash(lower), hash(upper))
+        self.assertTrue(lower.is_value(upper))
+        self.assertFalse(lower.is_value(Checksum(HashAlgorithms.SHA1, 'abc123')))
+
+    def test_immutable(self):
+        checksum = Checksum(HashAlgorithms.MD5, 'abc123')
+        with self.assertRaises(AttributeError):
+            checksum.value = 'def456'
+
 class FileItemTest(unittest.TestCase):
     def test_from_path(self):
         item = FileItem.from_file_path(PERSON_PATH)
@@ -31,7 +31,7 @@ import tests.resources.xml as XML
 import tests.resources.ips.unpacked as UNPACKED
 
 from eark_validator.mets import MetsValidator
-from eark_validator.ipxml.schema import LOCAL_SCHEMA, get_local_schema
+from eark_validator.ipxml.schema import LOCAL_SCHEMA, get_local_schema, get_ip_schema, get_profile_schema
 
 METS_XML = 'METS.xml'
 class MetsValidatorTest(unittest.TestCase):
@@ -46,6 +46,13 @@ class MetsValidatorTest(unittest.TestCase):
         self.assertTrue(is_valid)
         self.assertTrue(len(validator.validation_errors) == 0)
 
+    def test_nested_file_mets(self):
+        validator = MetsValidator(str(files(XML)))
+        is_valid = validator.validate_mets('METS-nested-file.xml')
+        self.assertTrue(is_valid)
+        paths = [file_ref.path for file_ref in validator.file_references]
+        self.assertEqual(paths[:2], ['schemas/inner.xsd', 'schemas/mets.xsd'])
+
     def test_invalid_mets(self):
         validator = MetsValidator(str(files(XML)))
         is_valid = validator.validate_mets('METS-no-root.xml')
@@ -88,5 +95,14 @@ class SchemaTest(unittest.TestCase):
             schema = get_local_schema(namespace)
             self.assertIsNotNone(schema)
 
+    def test_schema_compiled_once(self):
+        self.assertIs(get_ip_schema('csip'), get_ip_schema('csip'))
+        self.assertIsNot(get_ip_schema('csip'), get_ip_schema('sip'))
+        self.assertIs(get_profile_schema(), get_profile_schema())
+
+    def test_bad_ip_type(self):
+        with self.assertRaises(KeyError):
+            get_ip_schema('bad')
+
 if __name__ == '__main__':
     unittest.main()
@@ -216,6 +216,29 @@ class ValidationProfileTest(unittest.TestCase):
         self.assertTrue(profile.is_valid)
         self.assertEqual(len(result.warnings), 1)
 
+    def test_validate_files(self):
+        profile = SC.ValidationProfile.from_specification('CSIP')
+        results = profile.validate_files([str(files('tests.resources.xml').joinpath(METS_VALID)),
+                                          str(files('tests.resources').joinpath('empty.file')),
+                                          str(files('tests.resources.xml').joinpath('METS-no-hdr.xml'))],
+                                         workers=2)
+        self.assertEqual(len(results), 3)
+        reports, messages = results[0]
+        self.assertTrue(all(report.is_valid for report in reports.values()))
+        self.assertEqual(len(reports), 8)
+        self.assertEqual(messages, [])
+        reports, messages = results[1]
+        self.assertEqual(reports, {})
+        self.assertEqual(len(messages), 1)
+        self.assertIn('is not valid XML', messages[0])
+        reports, messages = results[2]
+        self.assertFalse(all(report.is_valid for report in reports.values()))
+
+    def test_validate_files_not_found(self):
+        profile = SC.ValidationProfile.from_specification('CSIP')
+        with self.assertRaises(FileNotFoundError):
+            profile.validate_files([str(files(SCHEMATRON).joinpath('not-found.xml'))], workers=1)
+
     def test_get_bad_key(self):
         profile = SC.ValidationProfile.from_specification('CSIP')
         profile.validate(str(files('tests.resources.xml').joinpath(METS_VALID)))
@@ -22,6 +22,8 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+import sys
+import threading
 import unittest
 
 from enum import Enum
@@ -29,6 +31,7 @@ from enum import Enum
 from importlib_resources import files
 
 from eark_validator import rules as SC
+from eark_validator.ipxml.schematron import clear_ruleset_cache, load_ruleset, _parser
 import tests.resources.schematron as SCHEMATRON
 import tests.resources.xml as XML
 
@@ -66,6 +69,47 @@ class SchematronTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             SC.SchematronRuleset(str(files(XML).joinpath(PERSON_XML)))
 
+    def test_load_ruleset_cached(self):
+        clear_ruleset_cache()
+        rules = load_ruleset(PERSON_PATH)
+        self.assertIs(rules, load_ruleset(PERSON_PATH))
+        clear_ruleset_cache()
+        self.assertIsNot(rules, load_ruleset(PERSON_PATH))
+
+    def test_validate_threaded(self):
+        rules = load_ruleset(SC.get_schematron_path('CSIP', 'metsRootElement'))
+        inputs = [(METS_VALID_PATH, True), (str(files(XML).joinpath('METS-no-hdr.xml')), False)] * 2
+        mismatches = []
+        def _validate(path, expected):
+            for _ in range(300):
+                report = rules.validate(path)
+                if SC.TestReport.from_validation_report(report).is_valid != expected:
+                    mismatches.append(path)
+        # Switch threads as often as possible so validations interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=_validate, args=item) for item in inputs]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(mismatches, [])
+
+    def test_parser_per_thread(self):
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(_parser()))
+        thread.start()
+        thread.join()
+        self.assertIs(_parser(), _parser())
+        self.assertIsNot(_parser(), parsers[0])
+
+    def test_load_ruleset_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            load_ruleset(NOT_FOUND_PATH)
+
     def test_load_schematron(self):
         assert_count = 0
         for _ in self._person_rules.get_assertions():
@@ -53,6 +53,15 @@ class SpecificationTest(unittest.TestCase):
         with self.assertRaises(ET.XMLSyntaxError):
             Specification._from_xml_file(str(files('tests.resources.xml').joinpath('person.xml')))
 
+    def test_shared_parser(self):
+        self.assertIs(Specification._parser(), Specification._parser())
+
+    def test_invalid_after_valid(self):
+        Specification._from_xml_file(EarkSpecifications.CSIP.path)
+        with self.assertRaises(ET.XMLSyntaxError):
+            Specification._from_xml_file(str(files('tests.resources.xml').joinpath('person.xml')))
+        self.assertEqual(Specification._from_xml_file(EarkSpecifications.SIP.path).version, 'SIPV2.0.4')
+
     def test_title(self):
         spec = EarkSpecifications.CSIP.specification
         self.assertEqual(spec.title, 'E-ARK CSIP METS Profile')
@@ -61,6 +70,15 @@ class SpecificationTest(unittest.TestCase):
         spec = EarkSpecifications.DIP.specification
         self.assertEqual(spec.title, 'E-ARK DIP METS Profile')
 
+    def test_eark_spec_title(self):
+        self.assertEqual(EarkSpecifications.CSIP.title, 'E-ARK-CSIP')
+        self.assertEqual(EarkSpecifications.SIP.title, 'E-ARK-SIP')
+        self.assertEqual(EarkSpecifications.DIP.title, 'E-ARK-DIP')
+
+    def test_eark_spec_path(self):
+        for spec in EarkSpecifications:
+            self.assertTrue(spec.path.endswith(spec.value + '.xml'))
+
     def test_url(self):
         spec = EarkSpecifications.CSIP.specification
         self.assertEqual(spec.url, 'https://earkcsip.dilcis.eu/profile/E-ARK-CSIP.xml')
@@ -101,6 +119,10 @@ class SpecificationTest(unittest.TestCase):
         self.assertEqual(rule_1, rule_1_by_sect)
         self.assertIsNone(spec.get_requirement_by_id('CSIP999'))
 
+    def test_requirement_name(self):
+        spec = EarkSpecifications.CSIP.specification
+        self.assertEqual(spec.get_requirement_by_id('CSIP1').name, 'Package Identifier')
+
     def test_sections(self):
         spec = EarkSpecifications.CSIP.specification
         self.assertTrue(spec.section_count > 0)
@@ -115,6 +137,10 @@ class SpecificationTest(unittest.TestCase):
         self.assertEqual(self._count_reqs_via_section(spec), spec.requirement_count)
         self.assertEqual(len(spec.section_requirements()), spec.requirement_count)
 
+    def test_str_missing_values(self):
+        self.assertEqual(str(Specification.Requirement('CSIP1', None)), 'id:CSIP1, name:None')
+        self.assertEqual(str(Specification('title', None, None, None)), 'name:title, version:None, date:None')
+
     def _count_reqs(self, spec):
         req_count = 0
         for _ in spec.requirements: